@@ -1,6 +1,9 @@
 import streamlit as st
 import json
+import functools
+import html
 import re
+import string
 from datetime import datetime
 
 st.set_page_config(
@@ -17,17 +20,8 @@ st.markdown("""
         font-family: 'Courier New', monospace;
         font-size: 12px;
     }
-    .url-text {
-        word-wrap: break-word;
-        word-break: break-all;
-        white-space: pre-wrap;
-        font-family: 'Courier New', monospace;
-        font-size: 11px;
-        background-color: #f0f2f6;
-        padding: 8px;
-        border-radius: 4px;
-        margin: 5px 0;
-    }
+    .fields-table { width: 100%; }
+    .fields-table td { border: none; padding: 4px 8px; width: 50%; }
     .success-box {
         border-left: 4px solid #00c853;
         padding: 15px;
@@ -63,6 +57,23 @@ class URLAuditor:
         r'\{js_',
     ]
 
+    # Compiled once; applied to the pre-lowered URL from _url_records
+    _TEMPLATE_KEYWORD_RES = [(kw, re.compile(kw, re.IGNORECASE)) for kw in TEMPLATE_KEYWORDS]
+    _TEMPLATE_RE = re.compile('|'.join(TEMPLATE_KEYWORDS), re.IGNORECASE)
+    _REGEX_PREFIXES = ("df", "if", "ev", "cp")
+    _PLACEHOLDER_URLS = frozenset(('nan', 'none', 'null', 'n/a', ''))
+    _BASEURL_HTTP = '${baseurl=:"http'
+    _DROP_UPPER = str.maketrans("", "", string.ascii_uppercase)
+    _ESCAPED_UPPER_RE = re.compile(r"\\[A-Z]|A\-Z")
+    _ACTIVE_STATUS_RE = re.compile(r"verified$|manual|escalated_to_technology_team")
+    _ANY_ACTIVE_STATUS_RE = re.compile(
+        r"verified|manual|escalated|website_is_down|internal_review"
+    )
+    _TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+    _QUOTE_NEWLINE_RE = re.compile(r'"\s*\n\s*"')
+    # A whole (possibly unterminated) JSON string, or a single brace
+    _JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|[{}]', re.DOTALL)
+
     @staticmethod
     def parse_json(text):
         """
@@ -88,35 +99,7 @@ class URLAuditor:
         # but respecting string boundaries (skip braces inside quotes)
         try:
             start = text.index('{')
-            in_string = False
-            escape_next = False
-            brace_depth = 0
-            end = start
-
-            for i in range(start, len(text)):
-                ch = text[i]
-
-                if escape_next:
-                    escape_next = False
-                    continue
-
-                if ch == '\\' and in_string:
-                    escape_next = True
-                    continue
-
-                if ch == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-
-                if not in_string:
-                    if ch == '{':
-                        brace_depth += 1
-                    elif ch == '}':
-                        brace_depth -= 1
-                        if brace_depth == 0:
-                            end = i + 1
-                            break
-
+            end = URLAuditor._matching_brace_end(text, start)
             extracted = text[start:end]
             return json.loads(extracted), None
         except (json.JSONDecodeError, ValueError) as e:
@@ -130,10 +113,10 @@ class URLAuditor:
             fixed = fixed[start_idx:]
 
             # Remove trailing commas before } or ]
-            fixed = re.sub(r',\s*([}\]])', r'\1', fixed)
+            fixed = URLAuditor._TRAILING_COMMA_RE.sub(r'\1', fixed)
 
             # Fix missing commas between lines ending with " and starting with "
-            fixed = re.sub(r'"\s*\n\s*"', '",\n"', fixed)
+            fixed = URLAuditor._QUOTE_NEWLINE_RE.sub('",\n"', fixed)
 
             return json.loads(fixed), None
         except (json.JSONDecodeError, ValueError) as e:
@@ -142,7 +125,7 @@ class URLAuditor:
         # Method 5: Try with single quotes replaced
         try:
             fixed = text.replace("'", '"')
-            fixed = re.sub(r',\s*([}\]])', r'\1', fixed)
+            fixed = URLAuditor._TRAILING_COMMA_RE.sub(r'\1', fixed)
             return json.loads(fixed), None
         except (json.JSONDecodeError, ValueError) as e:
             errs.append(f"Quote-fix: {str(e)}")
@@ -150,168 +133,182 @@ class URLAuditor:
         return None, errs
 
     @staticmethod
-    def urls_contain_templates(urls):
-        for u in urls:
-            if not isinstance(u, str):
-                continue
-            for kw in URLAuditor.TEMPLATE_KEYWORDS:
-                if re.search(kw, u, re.IGNORECASE):
-                    return True
-        return False
+    def _matching_brace_end(text, start):
+        """
+        Index just past the brace closing the one at `start`, or `start`
+        if it is never closed. Strings are consumed whole by the regex,
+        so only structural braces reach the Python loop.
+        """
+        depth = 0
+        for m in URLAuditor._JSON_TOKEN_RE.finditer(text, start):
+            tok = m.group()
+            if tok == '{':
+                depth += 1
+            elif tok == '}':
+                depth -= 1
+                if depth == 0:
+                    return m.end()
+        return start
+
+    @staticmethod
+    def _url_records(urls):
+        """
+        Pre-process the URL list once for every check.
+        Returns (index, url, url_lower, url_stripped) for each string URL;
+        index is 1-based and counts non-string entries too.
+        """
+        return [(i, u, u.lower(), u.strip())
+                for i, u in enumerate(urls, 1) if isinstance(u, str)]
+
+    @staticmethod
+    def _records_contain_templates(records):
+        """records are _url_records tuples, not a raw URL list."""
+        return any(URLAuditor._TEMPLATE_RE.search(low) for _, _, low, _ in records)
+
+    # Validator patterns for the per-URL checks, compiled once
+    _MINY_OK_RE = re.compile(r"\$\{miny=\:\d{4}\}")
+    _MINY_YEAR_RE = re.compile(r"\$\{y\}|\$\{ym1\}|\$\{yp1\}|\$\{y2\}|\$\{ym2\}")
+    _EPP_OK_RE = re.compile(r"\$\{epp=\:\d{1,2}\}")
+    _EPP_PAGE_RE = re.compile(r"\$\{p\}|\$\{pm1\}|\$\{pp1\}|\$\{stm1\}|\$\{st\}")
+    _XPATH_OK_RE = re.compile(
+        r"\$\{xpath=\:\<\{//.*\};\{\@.*\}\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\{.*\};;\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{.*\};;\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\{.*\};\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{.*\};\>\}.*xml"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};;\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{.\};;\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\{.*\};;;\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};;;\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{.\};\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\}\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};\{.\}\>\}"
+        r"|\$\{xpath=\:\<\{//tr\};\{td\[4\]\};\{td\[2\]\};\{td\[1\]\}\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};{.*\};\{.*\};\{.*}.*\>\}"
+        r"|\$\{xpath=\:\<\{//.*\};{.*\};\{.*\};;.*\>\}"
+    )
+    _ONCLICK_OK_RE = re.compile(r'\$\{onclick_var=\:\".*\"\}')
+    _JSARG_OK_RE = re.compile(r'\$\{jsarg=\:\d\}')
+    _JSON_OK_RE = re.compile(
+        r"\$\{json=\:\<\{cp\:\:"
+        r"|\$\{json=\:\<\".*\";\".*\";\".*\";\".*\"\>\}"
+        r"|\$\{json=\:\<\".*\";\".*\"\>\}"
+        r"|\$\{json=\:\<\".*\"; \".*\"\>\}"
+        r"|\$\{json=\:\<\".*\";\".*\";\>\}"
+        r"|\$\{json=\:\<\{tr\:\:"
+        r"|\$\{json=\:\<\".*\";\".*\";\".*\";\>\}"
+        r"|\$\{json=\:\<\".*\";\".*\";;\>\}"
+        r"|\$\{json=\:\<\".*\";\".*\";;;\>\}"
+        r"|GetFinancialReportListResult"
+        r"|GetPresentationListResult"
+        r"|GetEventListResult"
+        r"|\$\{json=\:\<\".*\";\".*\";\".*\";\".*\";\".*\";\".*\"\|\>\}"
+        r"|\$\{json=\:\<\".*\";\".*\";\".*\";\".*\";\".*\";\".*\"\|\".*;\".*\";.*\>\}"
+    )
+    _JSON_METHOD_RE = re.compile(
+        r'json\:xhr\:|json\:uepost\:xhr\:|json\:jspost\:xhr\:'
+        r'|json\:curl\:xhr\:|json\:curl\:|appid'
+        r'|json\:\$\{url\}|json\:xhr\:uepost\:'
+    )
+    _JSON_DATA_LOAD_OK_RE = re.compile(r"\$\{json_data_load=\:1\}|\$\{json_data_load=\:True\}")
+    _JS_JSON_OK_RE = re.compile(r"\$\{js_json=\:1\}")
+    _BASEURL_OK_RE = re.compile(r"\$\{baseurl=\:\".*\"\}|\$\{full_baseurl=\:True\}")
+    _WINDOW_FLAG_OK_RE = re.compile(
+        r"\$\{window_flag_regex=\:\".*\"\}|\$\{window_flag=\:True\}"
+    )
+    _COMPLEX_REGEX_RE = re.compile(r'\.\*|\.\+|\?[!<=(]|\[.*\]|\{.*\}|\\d|\\w|\\s|\(\?')
+    _TRAILING_SLASH_RE = re.compile(r'/?\??$')
+    _SINGLE_WORD_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+    # Per-URL checks: each takes (url, url_lower) and returns a list of
+    # (issue_type, details) pairs. audit_urls fills in url_index/url.
 
     @staticmethod
-    def check_miny(urls):
+    def check_miny(u, low):
         issues = []
-        pat = r"\$\{y\}|\$\{ym1\}|\$\{yp1\}|\$\{y2\}|\$\{ym2\}"
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{miny", u):
-                if not re.search(r"\$\{miny=\:\d{4}\}", u) or not re.search(pat, u):
-                    issues.append({"type": "MINY Template Incorrect", "url_index": i, "url": u})
+        if "{miny" in u:
+            if not URLAuditor._MINY_OK_RE.search(u) or not URLAuditor._MINY_YEAR_RE.search(u):
+                issues.append(("MINY Template Incorrect", None))
         return issues
 
     @staticmethod
-    def check_epp(urls):
+    def check_epp(u, low):
         issues = []
-        pat = r"\$\{p\}|\$\{pm1\}|\$\{pp1\}|\$\{stm1\}|\$\{st\}"
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{epp", u):
-                if not re.search(r"\$\{epp=\:\d{1,2}\}", u) or not re.search(pat, u):
-                    issues.append({"type": "EPP Template Incorrect", "url_index": i, "url": u})
+        if "{epp" in u:
+            if not URLAuditor._EPP_OK_RE.search(u) or not URLAuditor._EPP_PAGE_RE.search(u):
+                issues.append(("EPP Template Incorrect", None))
         return issues
 
     @staticmethod
-    def check_maxp(urls):
+    def check_maxp(u, low):
         """${maxp=:N} is for testing only — must NOT be in saved after URLs."""
         issues = []
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{maxp", u, re.IGNORECASE):
-                issues.append({
-                    "type": "MAXP Found - Must Be Removed",
-                    "url_index": i,
-                    "url": u,
-                    "details": "${maxp=:N} is for testing only. Must not be saved in after URLs."
-                })
+        if "{maxp" in low:
+            issues.append((
+                "MAXP Found - Must Be Removed",
+                "${maxp=:N} is for testing only. Must not be saved in after URLs."
+            ))
         return issues
 
     @staticmethod
-    def check_xpath(urls):
+    def check_xpath(u, low):
         issues = []
-        pat = (
-            r"\$\{xpath=\:\<\{//.*\};\{\@.*\}\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\{.*\};;\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{.*\};;\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\{.*\};\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{.*\};\>\}.*xml"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};;\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{.\};;\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\{.*\};;;\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};;;\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{.\};\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\}\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{\@.*\};\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};\{.\}\>\}"
-            r"|\$\{xpath=\:\<\{//tr\};\{td\[4\]\};\{td\[2\]\};\{td\[1\]\}\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};{.*\};\{.*\};\{.*}.*\>\}"
-            r"|\$\{xpath=\:\<\{//.*\};{.*\};\{.*\};;.*\>\}"
-        )
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{xpath", u) and not re.search(pat, u):
-                issues.append({"type": "XPATH Template Incorrect", "url_index": i, "url": u})
+        if "{xpath" in u and not URLAuditor._XPATH_OK_RE.search(u):
+            issues.append(("XPATH Template Incorrect", None))
         return issues
 
     @staticmethod
-    def check_onclick(urls):
+    def check_onclick(u, low):
         issues = []
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{onclick", u) and not re.search(r'\$\{onclick_var=\:\".*\"\}', u):
-                issues.append({"type": "ONCLICK Template Incorrect", "url_index": i, "url": u})
+        if "{onclick" in u and not URLAuditor._ONCLICK_OK_RE.search(u):
+            issues.append(("ONCLICK Template Incorrect", None))
         return issues
 
     @staticmethod
-    def check_jsarg(urls):
+    def check_jsarg(u, low):
         issues = []
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"jsarg", u) and not re.search(r'\$\{jsarg=\:\d\}', u):
-                issues.append({"type": "JSARG Template Incorrect", "url_index": i, "url": u})
+        if "jsarg" in u and not URLAuditor._JSARG_OK_RE.search(u):
+            issues.append(("JSARG Template Incorrect", None))
         return issues
 
     @staticmethod
-    def check_json_template(urls):
+    def check_json_template(u, low):
         issues = []
-        jp = (
-            r"\$\{json=\:\<\{cp\:\:"
-            r"|\$\{json=\:\<\".*\";\".*\";\".*\";\".*\"\>\}"
-            r"|\$\{json=\:\<\".*\";\".*\"\>\}"
-            r"|\$\{json=\:\<\".*\"; \".*\"\>\}"
-            r"|\$\{json=\:\<\".*\";\".*\";\>\}"
-            r"|\$\{json=\:\<\{tr\:\:"
-            r"|\$\{json=\:\<\".*\";\".*\";\".*\";\>\}"
-            r"|\$\{json=\:\<\".*\";\".*\";;\>\}"
-            r"|\$\{json=\:\<\".*\";\".*\";;;\>\}"
-            r"|GetFinancialReportListResult"
-            r"|GetPresentationListResult"
-            r"|GetEventListResult"
-            r"|\$\{json=\:\<\".*\";\".*\";\".*\";\".*\";\".*\";\".*\"\|\>\}"
-            r"|\$\{json=\:\<\".*\";\".*\";\".*\";\".*\";\".*\";\".*\"\|\".*;\".*\";.*\>\}"
-        )
-        mp = (
-            r'json\:xhr\:|json\:uepost\:xhr\:|json\:jspost\:xhr\:'
-            r'|json\:curl\:xhr\:|json\:curl\:|appid'
-            r'|json\:\$\{url\}|json\:xhr\:uepost\:'
-        )
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{json=", u):
-                if not re.search(jp, u) or not re.search(mp, u):
-                    issues.append({"type": "JSON Template Incorrect", "url_index": i, "url": u})
-            elif re.search(r"\{json_", u):
-                if not re.search(r"\$\{json_data_load=\:1\}|\$\{json_data_load=\:True\}", u):
-                    issues.append({"type": "JSON Data Load Incorrect", "url_index": i, "url": u})
-            elif re.search(r"\{js_", u):
-                if not re.search(r"\$\{js_json=\:1\}", u):
-                    issues.append({"type": "JS JSON Incorrect", "url_index": i, "url": u})
+        if "{js" not in u:
+            return issues
+        if "{json=" in u:
+            if not URLAuditor._JSON_OK_RE.search(u) or not URLAuditor._JSON_METHOD_RE.search(u):
+                issues.append(("JSON Template Incorrect", None))
+        elif "{json_" in u:
+            if not URLAuditor._JSON_DATA_LOAD_OK_RE.search(u):
+                issues.append(("JSON Data Load Incorrect", None))
+        elif "{js_" in u:
+            if not URLAuditor._JS_JSON_OK_RE.search(u):
+                issues.append(("JS JSON Incorrect", None))
         return issues
 
     @staticmethod
-    def check_baseurl(urls):
+    def check_baseurl(u, low):
         issues = []
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{baseurl", u):
-                if not re.search(r"\$\{baseurl=\:\".*\"\}|\$\{full_baseurl=\:True\}", u):
-                    issues.append({"type": "BASEURL Template Incorrect", "url_index": i, "url": u})
+        if "{baseurl" in u:
+            if not URLAuditor._BASEURL_OK_RE.search(u):
+                issues.append(("BASEURL Template Incorrect", None))
         return issues
 
     @staticmethod
-    def check_windowflag(urls):
+    def check_windowflag(u, low):
         issues = []
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if re.search(r"\{window", u):
-                if not re.search(r"\$\{window_flag_regex=\:\".*\"\}|\$\{window_flag=\:True\}", u):
-                    issues.append({"type": "Window Flag Incorrect", "url_index": i, "url": u})
+        if "{window" in u:
+            if not URLAuditor._WINDOW_FLAG_OK_RE.search(u):
+                issues.append(("Window Flag Incorrect", None))
         return issues
 
     @staticmethod
     def _get_regex_body(url):
-        m = re.match(r'^(ev|cp|df|if):(.*)', url, re.IGNORECASE)
-        if m:
-            return m.group(2)
+        # Text after "xx:" up to the first newline, prefix case-insensitive
+        if url[2:3] == ":" and url[:2].lower() in URLAuditor._REGEX_PREFIXES:
+            return url[3:].partition("\n")[0]
         return None
 
     @staticmethod
@@ -330,16 +327,13 @@ class URLAuditor:
 
             clean = alt.lstrip('/')
 
-            has_complex = bool(re.search(
-                r'\.\*|\.\+|\?[!<=(]|\[.*\]|\{.*\}|\\d|\\w|\\s|\(\?',
-                clean
-            ))
+            has_complex = bool(URLAuditor._COMPLEX_REGEX_RE.search(clean))
             if has_complex:
                 continue
 
-            clean_check = re.sub(r'/?\??$', '', clean)
+            clean_check = URLAuditor._TRAILING_SLASH_RE.sub('', clean)
 
-            if re.match(r'^[a-zA-Z0-9_-]+$', clean_check):
+            if URLAuditor._SINGLE_WORD_RE.match(clean_check):
                 weak_parts.append(alt)
 
         if weak_parts:
@@ -348,44 +342,39 @@ class URLAuditor:
         return False, ""
 
     @staticmethod
-    def check_regex(urls):
+    def check_regex(u, low):
         issues = []
+        if len(u) < 4:
+            return issues
+        if not u.startswith(URLAuditor._REGEX_PREFIXES):
+            return issues
+
+        if len(u) >= 11:
+            has_up = len(u) != len(u.translate(URLAuditor._DROP_UPPER))
+            if has_up and not URLAuditor._ESCAPED_UPPER_RE.search(u):
+                issues.append(("Regex - Uppercase not escaped", None))
+            elif u[2] != ":":
+                issues.append(("Regex - Missing colon", None))
+
+        regex_body = URLAuditor._get_regex_body(u)
+        if regex_body:
+            is_weak, weak_reason = URLAuditor._is_weak_regex(regex_body)
+            if is_weak:
+                issues.append((
+                    "Weak Regex",
+                    f"Regex should match multi-word paths. {weak_reason}"
+                ))
+        return issues
 
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str) or len(u) < 4:
-                continue
-            if not re.search(r"^ev|^df|^cp|^if", u):
-                continue
-
-            has_up = bool(re.search(r"[A-Z]", u))
-            has_esc = bool(re.search(r"\\[A-Z]|A\-Z", u))
-            if len(u) >= 11 and has_up and not has_esc:
-                issues.append({
-                    "type": "Regex - Uppercase not escaped",
-                    "url_index": i, "url": u
-                })
-            elif len(u) >= 11 and u[2] != ":":
-                issues.append({
-                    "type": "Regex - Missing colon",
-                    "url_index": i, "url": u
-                })
-
-            regex_body = URLAuditor._get_regex_body(u)
-            if regex_body:
-                is_weak, weak_reason = URLAuditor._is_weak_regex(regex_body)
-                if is_weak:
-                    issues.append({
-                        "type": "Weak Regex",
-                        "url_index": i, "url": u,
-                        "details": f"Regex should match multi-word paths. {weak_reason}"
-                    })
-
+    @staticmethod
+    def _regex_count_issues(records):
+        issues = []
         type_counts = {"ev": [], "cp": [], "df": [], "if": []}
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str) or len(u) < 4:
+        for i, u, low, _ in records:
+            if len(u) < 4:
                 continue
             for prefix in type_counts:
-                if u.lower().startswith(prefix + ":"):
+                if low.startswith(prefix + ":"):
                     type_counts[prefix].append(i)
                     break
 
@@ -404,53 +393,85 @@ class URLAuditor:
         return issues
 
     @staticmethod
-    def check_http(urls):
+    def _has_multi_http(low):
+        """Same result as re.search(r"http.*http") — both hits on one line."""
+        first = low.find("http")
+        if first < 0 or low.find("http", first + 4) < 0:
+            return False
+        if "\n" not in low:
+            return True
+        return any(line.count("http") > 1 for line in low.split("\n"))
+
+    @staticmethod
+    def check_http(u, low):
         issues = []
-        skip = '|'.join([r'^df', r'^if', r'^ev', r'^cp'])
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str) or len(u) <= 5:
-                continue
-            if re.search(skip, u, re.IGNORECASE):
-                continue
-            has_http = "http" in u.lower()
-            has_multi = bool(re.search(r"http.*http", u, re.IGNORECASE))
-            if has_multi:
-                cleaned = re.sub(r'\$\{baseurl\=\:\"http', '', u, count=1, flags=re.IGNORECASE)
-                has_multi = bool(re.search(r"http.*http", cleaned, re.IGNORECASE))
-            if not has_http:
-                issues.append({"type": "Missing HTTP/HTTPS", "url_index": i, "url": u})
-            elif has_multi:
-                issues.append({"type": "Multiple HTTP in URL", "url_index": i, "url": u})
-            elif re.search(r"\n", u):
-                issues.append({"type": "Newline in URL", "url_index": i, "url": u})
+        if len(u) <= 5 or low.startswith(URLAuditor._REGEX_PREFIXES):
+            return issues
+        if "http" not in low:
+            issues.append(("Missing HTTP/HTTPS", None))
+            return issues
+        has_multi = URLAuditor._has_multi_http(low)
+        if has_multi:
+            marker = URLAuditor._BASEURL_HTTP
+            pos = low.find(marker)
+            if pos >= 0:
+                has_multi = URLAuditor._has_multi_http(
+                    low[:pos] + low[pos + len(marker):]
+                )
+        if has_multi:
+            issues.append(("Multiple HTTP in URL", None))
+        elif "\n" in u:
+            issues.append(("Newline in URL", None))
         return issues
 
     @staticmethod
-    def check_brackets(urls):
+    def check_brackets(u, low):
         issues = []
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            if u.count("{") != u.count("}"):
-                issues.append({
-                    "type": "Mismatched Brackets", "url_index": i, "url": u,
-                    "details": f"Open: {u.count('{')}, Close: {u.count('}')}"
-                })
+        opened, closed = u.count("{"), u.count("}")
+        if opened != closed:
+            issues.append(("Mismatched Brackets", f"Open: {opened}, Close: {closed}"))
         return issues
 
+    # Report order; unwrapped so the plain functions can be called from the tuple
+    _URL_CHECKS = tuple(fn.__func__ for fn in (
+        check_miny, check_epp, check_maxp, check_xpath, check_onclick,
+        check_jsarg, check_json_template, check_baseurl, check_windowflag,
+        check_regex, check_http, check_brackets,
+    ))
+    # Regex count issues are reported right after check_regex's own
+    _REGEX_CHECK_POS = _URL_CHECKS.index(check_regex.__func__)
+    # Checks that only fire on a "${name" tag and so can be skipped for URLs
+    # without "{". Keep this in sync when adding template checks; anything
+    # not listed here runs on every URL.
+    _BRACE_ONLY_CHECKS = frozenset(fn.__func__ for fn in (
+        check_miny, check_epp, check_maxp, check_xpath, check_onclick,
+        check_json_template, check_baseurl, check_windowflag,
+    ))
+
     @staticmethod
-    def check_duplicates(urls):
-        issues = []
-        m = {}
-        for i, u in enumerate(urls, 1):
-            if not isinstance(u, str):
-                continue
-            c = u.strip()
-            if len(c) <= 3 or c.lower() in ('nan', 'none', 'null', 'n/a', ''):
+    @functools.lru_cache(maxsize=100_000)
+    def _classify_url(u, low):
+        """
+        Run every per-URL check on one URL. Memoized: QA batches repeat the
+        same URLs across records and the result depends on the URL alone.
+        Returns a tuple of (check_position, issue_type, details).
+        """
+        found = []
+        skip = () if "{" in u else URLAuditor._BRACE_ONLY_CHECKS
+        for pos, check in enumerate(URLAuditor._URL_CHECKS):
+            if check in skip:
                 continue
-            m.setdefault(c, []).append(i)
-        for u, idx in m.items():
-            if len(idx) > 1:
+            for itype, details in check(u, low):
+                found.append((pos, itype, details))
+        return tuple(found)
+
+    @staticmethod
+    def _duplicate_issues(positions):
+        """positions maps each stripped URL to its index, or to a list of
+        indices once it has been seen more than once."""
+        issues = []
+        for u, idx in positions.items():
+            if isinstance(idx, list):
                 issues.append({
                     "type": "Duplicate URL", "url_indices": idx,
                     "url": u, "occurrences": len(idx)
@@ -458,34 +479,52 @@ class URLAuditor:
         return issues
 
     @staticmethod
-    def check_metadata(data):
+    def _text_field(data, key):
+        """Metadata value as stripped text; missing or falsy values become ''."""
+        return str(data.get(key) or "").strip()
+
+    @staticmethod
+    def check_metadata(data, records=None):
         issues = []
-        agent = str(data.get("status", "") or "").strip().lower()
-        ct = str(data.get("case_type", "") or "").strip().lower()
-        proj = str(data.get("project", "") or "").strip()
-        rs = str(data.get("research_status", "") or "").strip().lower()
-        ia = str(data.get("issue_area", "") or "").strip()
-        fs = str(data.get("final_status", "") or "").strip()
-        irsp = str(data.get("irsp_provider", "") or "").strip()
+        field = URLAuditor._text_field
+        agent = field(data, "status").lower()
+        ct = field(data, "case_type").lower()
+        proj = field(data, "project")
+        rs = field(data, "research_status").lower()
+        ia = field(data, "issue_area")
+        fs = field(data, "final_status")
+        irsp = field(data, "irsp_provider")
         aurls = data.get("after_save_pageurls", [])
-
-        is_active = bool(re.search(
-            r"verified$|manual|escalated_to_technology_team", agent
-        ))
-        has_active = bool(re.search(
-            r"verified|manual|escalated|website_is_down|internal_review", agent
-        ))
+        if records is None:
+            records = URLAuditor._url_records(aurls)
+
+        # One sweep over the URLs collects every marker the rules below need
+        has_curl = has_s3 = has_wd = has_cp = has_text = False
+        for i, u, low, stripped in records:
+            if "curl:" in u:
+                has_curl = True
+            if "s3.amazonaws.com" in u:
+                has_s3 = True
+            if "wd:" in u:
+                has_wd = True
+            if stripped.startswith("cp:"):
+                has_cp = True
+            if i <= 3 and low.lstrip().startswith("text:"):
+                has_text = True
+
+        is_active = bool(URLAuditor._ACTIVE_STATUS_RE.search(agent))
+        has_active = bool(URLAuditor._ANY_ACTIVE_STATUS_RE.search(agent))
 
         if is_active and not ct:
             issues.append({"type": "Metadata Error", "field": "case_type",
                            "message": "No Case Type with active Agent status"})
 
-        if any("curl:" in str(u) for u in aurls if isinstance(u, str)):
+        if has_curl:
             if ct != "cookie_case":
                 issues.append({"type": "Metadata Error", "field": "case_type",
                                "message": "curl: found but case_type not cookie_case"})
 
-        if any("s3.amazonaws.com" in str(u) for u in aurls if isinstance(u, str)):
+        if has_s3:
             if ct != "manual_solution_webpage_generated":
                 issues.append({"type": "Metadata Error", "field": "case_type",
                                "message": "S3 URL but case_type not manual_solution_webpage_generated"})
@@ -507,18 +546,15 @@ class URLAuditor:
             issues.append({"type": "Metadata Error", "field": "irsp_provider",
                            "message": "Q4Web with non-active status"})
 
-        wd = [u for u in aurls if isinstance(u, str) and re.search(r"wd:", u)]
-        if wd and ct == "direct":
+        if has_wd and ct == "direct":
             issues.append({"type": "Metadata Error", "field": "case_type",
                            "message": "WD in URLs but case_type=direct"})
 
-        if ct == "direct" and aurls and URLAuditor.urls_contain_templates(aurls):
+        if ct == "direct" and aurls and URLAuditor._records_contain_templates(records):
             found_keywords = []
-            for u in aurls:
-                if not isinstance(u, str):
-                    continue
-                for kw in URLAuditor.TEMPLATE_KEYWORDS:
-                    if re.search(kw, u, re.IGNORECASE):
+            for _, _, low, _ in records:
+                for kw, kw_re in URLAuditor._TEMPLATE_KEYWORD_RES:
+                    if kw_re.search(low):
                         display_kw = kw.replace(r'\{', '{').replace(r'\:', ':')
                         if display_kw not in found_keywords:
                             found_keywords.append(display_kw)
@@ -536,18 +572,10 @@ class URLAuditor:
                 issues.append({"type": "Metadata Error", "field": "final_status",
                                "message": "Final Status blank"})
 
-        has_cp = any(
-            isinstance(u, str) and u.strip().startswith("cp:") for u in aurls
-        )
         if has_cp and irsp:
             issues.append({"type": "Metadata Error", "field": "irsp_provider",
                            "message": f"cp: in URLs but irsp_provider='{irsp}'"})
 
-        f3 = aurls[:3] if len(aurls) >= 3 else aurls
-        has_text = any(
-            isinstance(u, str) and u.strip().lower().startswith("text:")
-            for u in f3
-        )
         if has_text and irsp != "Q4Web":
             issues.append({"type": "Metadata Error", "field": "irsp_provider",
                            "message": f"text: in first 3 URLs but irsp_provider='{irsp}'"})
@@ -557,26 +585,88 @@ class URLAuditor:
     @classmethod
     def audit_urls(cls, data):
         urls = data.get("after_save_pageurls", [])
+        records = cls._url_records(urls)
         issues = []
-        if urls:
-            for fn in [cls.check_miny, cls.check_epp, cls.check_maxp,
-                       cls.check_xpath, cls.check_onclick, cls.check_jsarg,
-                       cls.check_json_template, cls.check_baseurl,
-                       cls.check_windowflag, cls.check_regex, cls.check_http,
-                       cls.check_brackets, cls.check_duplicates]:
-                issues.extend(fn(urls))
-        issues.extend(cls.check_metadata(data))
+        if records:
+            # One bucket per check keeps the report grouped check by check
+            buckets = [[] for _ in cls._URL_CHECKS]
+            positions = {}
+            for i, u, low, c in records:
+                for pos, itype, details in cls._classify_url(u, low):
+                    issue = {"type": itype, "url_index": i, "url": u}
+                    if details is not None:
+                        issue["details"] = details
+                    buckets[pos].append(issue)
+                # Placeholders are at most 4 chars, so longer URLs skip lower()
+                if len(c) > 4 or (len(c) == 4 and c.lower() not in cls._PLACEHOLDER_URLS):
+                    seen = positions.get(c)
+                    if seen is None:
+                        positions[c] = i
+                    elif isinstance(seen, int):
+                        positions[c] = [seen, i]
+                    else:
+                        seen.append(i)
+            buckets[cls._REGEX_CHECK_POS].extend(
+                cls._regex_count_issues(records)
+            )
+            for bucket in buckets:
+                issues.extend(bucket)
+            issues.extend(cls._duplicate_issues(positions))
+        issues.extend(cls.check_metadata(data, records))
         return {"status": "Complete", "total_urls": len(urls),
                 "issues_found": len(issues), "issues": issues}
 
 
-def display_url_wrapped(url):
-    return f'<div class="url-text">{url}</div>'
+def issue_rows(ilist):
+    """One table row per issue, with only the columns the issues carry."""
+    rows = []
+    for i, iss in enumerate(ilist, 1):
+        row = {"#": i}
+        if 'url_index' in iss:
+            row["Index"] = iss['url_index']
+        if 'url_indices' in iss:
+            row["Positions"] = ", ".join(map(str, iss['url_indices']))
+        if 'field' in iss:
+            row["Field"] = iss['field']
+            row["Message"] = iss['message']
+        if 'url' in iss:
+            row["URL"] = iss['url']
+        if 'details' in iss:
+            row["Details"] = iss['details']
+        rows.append(row)
+    return rows
+
+
+def parsed_fields_table(data):
+    """Both field columns as one HTML table, sent in a single element."""
+    left = ['status', 'case_type', 'project', 'issue_area']
+    right = ['final_status', 'irsp_provider', 'research_status', 'verified']
+    rows = "".join(
+        f"<tr><td><b>{a}:</b> {html.escape(str(data.get(a, 'N/A')))}</td>"
+        f"<td><b>{b}:</b> {html.escape(str(data.get(b, 'N/A')))}</td></tr>"
+        for a, b in zip(left, right)
+    )
+    return f'<table class="fields-table">{rows}</table>'
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def run_audit(json_input):
+    """
+    Parse and audit pasted JSON. Cached on the text itself, so running
+    unchanged input again is a lookup. Returns (data, errors, result,
+    report_json); data and result are None when parsing fails.
+    """
+    data, errs = URLAuditor.parse_json(json_input)
+    if data is None:
+        return None, errs, None, None
+    res = URLAuditor.audit_urls(data)
+    return data, errs, res, json.dumps(res, indent=2)
 
 
 def clear_all():
     st.session_state.audit_result_data = None
     st.session_state.audit_json_data = None
+    st.session_state.audit_report_json = None
     st.session_state.json_ta = ""
 
 
@@ -616,6 +706,8 @@ def main():
         st.session_state.audit_result_data = None
     if 'audit_json_data' not in st.session_state:
         st.session_state.audit_json_data = None
+    if 'audit_report_json' not in st.session_state:
+        st.session_state.audit_report_json = None
 
     st.subheader("📝 JSON Input")
     json_input = st.text_area(
@@ -630,10 +722,10 @@ def main():
     with b2:
         st.button("🗑️ Clear All", use_container_width=True, on_click=clear_all)
     with b3:
-        if st.session_state.audit_result_data is not None:
+        if st.session_state.audit_report_json is not None:
             st.download_button(
                 "📥 Audit Report",
-                data=json.dumps(st.session_state.audit_result_data, indent=2),
+                data=st.session_state.audit_report_json,
                 file_name=f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json", use_container_width=True
             )
@@ -643,7 +735,7 @@ def main():
             st.warning("⚠️ Paste JSON first!")
         else:
             with st.spinner("🔄 Auditing..."):
-                data, errs = URLAuditor.parse_json(json_input)
+                data, errs, res, report = run_audit(json_input)
                 if data is None:
                     st.error("❌ JSON parse failed")
                     with st.expander("Errors"):
@@ -655,8 +747,10 @@ def main():
                         "or unclosed strings."
                     )
                 else:
-                    st.session_state.audit_result_data = URLAuditor.audit_urls(data)
+                    st.session_state.audit_result_data = res
                     st.session_state.audit_json_data = data
+                    # Serialized once per audit rather than on every rerun
+                    st.session_state.audit_report_json = report
                     st.success("✅ Done!")
 
     if (st.session_state.audit_result_data is not None
@@ -669,6 +763,7 @@ def main():
             st.error("Audit results corrupted. Please run audit again.")
             st.session_state.audit_result_data = None
             st.session_state.audit_json_data = None
+            st.session_state.audit_report_json = None
             st.rerun()
             return
 
@@ -688,13 +783,7 @@ def main():
                        "✅ PASS" if res.get("issues_found", 0) == 0 else "❌ FAIL")
 
         with st.expander("📋 Parsed Fields", expanded=False):
-            f1, f2 = st.columns(2)
-            with f1:
-                for f in ['status', 'case_type', 'project', 'issue_area']:
-                    st.write(f"**{f}:** {data.get(f, 'N/A')}")
-            with f2:
-                for f in ['final_status', 'irsp_provider', 'research_status', 'verified']:
-                    st.write(f"**{f}:** {data.get(f, 'N/A')}")
+            st.markdown(parsed_fields_table(data), unsafe_allow_html=True)
 
         if res.get("issues_found", 0) == 0:
             st.markdown(
@@ -708,23 +797,9 @@ def main():
                 by_type.setdefault(iss["type"], []).append(iss)
             for itype, ilist in by_type.items():
                 with st.expander(f"**{itype}** ({len(ilist)})", expanded=True):
-                    for i, iss in enumerate(ilist, 1):
-                        st.markdown(f"**#{i}:**")
-                        if 'url_index' in iss:
-                            st.write(f"📍 Index: {iss['url_index']}")
-                        if 'url_indices' in iss:
-                            st.write(f"📍 Positions: {iss['url_indices']}")
-                        if 'field' in iss:
-                            st.write(f"🏷️ `{iss['field']}` — {iss['message']}")
-                        if 'url' in iss:
-                            st.markdown(
-                                display_url_wrapped(iss['url']),
-                                unsafe_allow_html=True
-                            )
-                        if 'details' in iss:
-                            st.info(iss['details'])
-                        if i < len(ilist):
-                            st.markdown("---")
+                    st.dataframe(
+                        issue_rows(ilist), hide_index=True, use_container_width=True
+                    )
             st.table([{"Issue": t, "Count": len(l)} for t, l in by_type.items()])
 
     st.markdown("---")